@@ -9,27 +9,41 @@ Usage:
     python accessibility_audit.py <path_to_html_file_or_directory>
     python accessibility_audit.py <path> --format json
     python accessibility_audit.py <path> --wcag-level AAA
+    python accessibility_audit.py <path> --cache
+    python accessibility_audit.py <path> --jobs 4
 
 Requirements:
-    pip install beautifulsoup4 lxml
+    Python 3.10+
+    pip install lxml
+    pip install orjson  (optional, faster JSON output)
 """
 
 import sys
 import os
+import argparse
 import re
 import json
+import shelve
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Tuple
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, fields
 
 try:
-    from bs4 import BeautifulSoup, Tag
+    from lxml import etree
+    from lxml.html import HTMLParser, HtmlElement, document_fromstring, parse
 except ImportError:
-    print("Error: BeautifulSoup4 is required. Install with: pip install beautifulsoup4 lxml")
+    print("Error: lxml is required. Install with: pip install lxml")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
-@dataclass
+@dataclass(slots=True)
 class AccessibilityIssue:
     """Represents a single accessibility issue"""
     severity: str  # 'error', 'warning', 'info'
@@ -43,33 +57,86 @@ class AccessibilityIssue:
 class AccessibilityAuditor:
     """Performs accessibility audits on HTML content"""
 
+    # XPath expressions are compiled once at class creation so each audit
+    # only evaluates them (in libxml2) rather than re-parsing the query
+    _TABLE_HEADERS = etree.XPath('.//th')
+    _ARIA_ROLES = etree.XPath('descendant-or-self::*[@role]')
+
+    _HEADING_LEVELS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+    _SUSPICIOUS_ALT = ('image of', 'picture of', 'graphic of', 'photo of')
+    _GENERIC_LINK_TEXT = frozenset({'click here', 'read more', 'more', 'link', 'here'})
+    _SKIP_INPUT_TYPES = frozenset({'hidden', 'submit', 'button', 'reset'})
+
+    # ARIA roles that duplicate a native element, mapped to that element
+    _DISCOURAGED_ROLES = {
+        'button': '<button>',
+        'link': '<a href="">',
+        'checkbox': '<input type="checkbox">',
+        'radio': '<input type="radio">',
+        'textbox': '<input type="text">',
+    }
+
     def __init__(self, wcag_level='AA'):
         self.wcag_level = wcag_level
         self.issues: List[AccessibilityIssue] = []
 
     def audit_html(self, html_content: str, filename: str = "") -> List[AccessibilityIssue]:
         """Main audit function"""
+        # lxml rejects str input that carries an encoding declaration
+        # (e.g. XHTML), so parse it as UTF-8 bytes instead
+        if html_content.startswith('<?xml'):
+            html_content = html_content.encode('utf-8')
+            parser = HTMLParser(encoding='utf-8')
+        else:
+            parser = None
+
+        try:
+            root = document_fromstring(html_content, parser=parser)
+        except etree.ParserError:
+            # Blank input: audit it as an empty document
+            root = None
+
+        return self.audit_tree(root)
+
+    def audit_tree(self, root: Optional[HtmlElement]) -> List[AccessibilityIssue]:
+        """Audit an already parsed document
+
+        A root of None is audited as an empty document, so only the
+        page-level checks report issues.
+        """
         self.issues = []
-        soup = BeautifulSoup(html_content, 'lxml')
-
-        # Run all checks
-        self._check_images(soup)
-        self._check_headings(soup)
-        self._check_links(soup)
-        self._check_forms(soup)
-        self._check_page_structure(soup)
-        self._check_semantic_html(soup)
-        self._check_tables(soup)
-        self._check_buttons(soup)
-        self._check_language(soup)
-        self._check_aria_usage(soup)
+
+        # Page-level state aggregated during the walk
+        self._heading_count = 0
+        self._h1_count = 0
+        self._prev_heading_level = 0
+        self._has_main = False
+        self._nav_elements = []
+        self._unlabelled_controls = []
+        self._label_targets = set()
+
+        # Single traversal: lxml only yields tags that have a handler, so
+        # the filtering happens in C and each yielded element is dispatched
+        if root is not None:
+            handlers = self._HANDLERS
+            for elem in root.iter(*handlers):
+                handlers[elem.tag](self, elem)
+
+            # Role checks apply to any element; select them natively
+            for elem in self._ARIA_ROLES(root):
+                self._check_role(elem, elem.get('role'))
+
+        # Checks that need the whole page
+        self._check_headings()
+        self._check_form_labels()
+        self._check_page_structure()
 
         return self.issues
 
     def _add_issue(self, severity: str, wcag: str, message: str,
-                   element: Tag = None, suggestion: str = ""):
+                   element: HtmlElement = None, suggestion: str = ""):
         """Helper to add an issue to the list"""
-        element_str = str(element)[:100] if element else ""
+        element_str = self._describe_element(element) if element is not None else ""
         self.issues.append(AccessibilityIssue(
             severity=severity,
             wcag_criterion=wcag,
@@ -78,39 +145,84 @@ class AccessibilityAuditor:
             suggestion=suggestion
         ))
 
-    def _check_images(self, soup: BeautifulSoup):
+    @staticmethod
+    def _describe_element(element: HtmlElement) -> str:
+        """Render an element's start tag, truncated to 100 characters
+
+        Only the tag and its attributes are used, so the cost does not grow
+        with the size of the element's subtree.
+        """
+        attrs = ''.join(f' {name}="{value}"' for name, value in element.items())
+        return f'<{element.tag}{attrs}>'[:100]
+
+    @staticmethod
+    def _has_text(element: HtmlElement) -> bool:
+        """Check whether an element contains any non-whitespace text
+
+        Stops at the first non-blank text node instead of building the
+        element's full text content.
+        """
+        return any(chunk.strip() for chunk in element.itertext())
+
+    def _check_image(self, img: HtmlElement):
         """Check image alt text - WCAG 1.1.1"""
-        images = soup.find_all('img')
+        alt = img.get('alt')
+
+        # Check for missing alt attribute
+        if alt is None:
+            self._add_issue(
+                'error',
+                '1.1.1',
+                'Image missing alt attribute',
+                img,
+                'Add alt="" for decorative images or descriptive alt text for meaningful images'
+            )
 
-        for img in images:
-            # Check for missing alt attribute
-            if not img.has_attr('alt'):
+        # Check for suspicious alt text
+        elif alt.strip():
+            alt_text = alt.lower()
+            if any(pattern in alt_text for pattern in self._SUSPICIOUS_ALT):
                 self._add_issue(
-                    'error',
+                    'warning',
                     '1.1.1',
-                    'Image missing alt attribute',
+                    f'Alt text may be overly descriptive: "{alt}"',
                     img,
-                    'Add alt="" for decorative images or descriptive alt text for meaningful images'
+                    'Describe content/function, not that it\'s an image'
                 )
 
-            # Check for suspicious alt text
-            elif img.get('alt', '').strip():
-                alt_text = img.get('alt', '').lower()
-                suspicious_patterns = ['image of', 'picture of', 'graphic of', 'photo of']
-                if any(pattern in alt_text for pattern in suspicious_patterns):
-                    self._add_issue(
-                        'warning',
-                        '1.1.1',
-                        f'Alt text may be overly descriptive: "{img.get("alt")}"',
-                        img,
-                        'Describe content/function, not that it\'s an image'
-                    )
-
-    def _check_headings(self, soup: BeautifulSoup):
+    def _check_heading(self, heading: HtmlElement):
         """Check heading hierarchy - WCAG 1.3.1, 2.4.6"""
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+        current_level = self._HEADING_LEVELS[heading.tag]
+        prev_level = self._prev_heading_level
+
+        self._heading_count += 1
+        if current_level == 1:
+            self._h1_count += 1
+
+        if prev_level > 0 and current_level - prev_level > 1:
+            self._add_issue(
+                'error',
+                '1.3.1',
+                f'Heading level skipped: {heading.tag} follows h{prev_level}',
+                heading,
+                'Never skip heading levels (e.g., h1 → h3)'
+            )
 
-        if not headings:
+        # Check for empty headings
+        if not self._has_text(heading):
+            self._add_issue(
+                'error',
+                '2.4.6',
+                f'Empty heading: {heading.tag}',
+                heading,
+                'All headings must contain text content'
+            )
+
+        self._prev_heading_level = current_level
+
+    def _check_headings(self):
+        """Check page heading counts - WCAG 2.4.6"""
+        if not self._heading_count:
             self._add_issue(
                 'warning',
                 '2.4.6',
@@ -120,7 +232,7 @@ class AccessibilityAuditor:
             return
 
         # Check for h1
-        h1_count = len(soup.find_all('h1'))
+        h1_count = self._h1_count
         if h1_count == 0:
             self._add_issue(
                 'error',
@@ -136,118 +248,98 @@ class AccessibilityAuditor:
                 suggestion='Use only one h1 per page'
             )
 
-        # Check heading hierarchy
-        prev_level = 0
-        for heading in headings:
-            current_level = int(heading.name[1])
-
-            if prev_level > 0 and current_level - prev_level > 1:
-                self._add_issue(
-                    'error',
-                    '1.3.1',
-                    f'Heading level skipped: {heading.name} follows h{prev_level}',
-                    heading,
-                    'Never skip heading levels (e.g., h1 → h3)'
-                )
-
-            # Check for empty headings
-            if not heading.get_text(strip=True):
-                self._add_issue(
-                    'error',
-                    '2.4.6',
-                    f'Empty heading: {heading.name}',
-                    heading,
-                    'All headings must contain text content'
-                )
+    def _check_link(self, link: HtmlElement):
+        """Check link accessibility - WCAG 2.4.4"""
+        link_text = link.text_content().strip()
 
-            prev_level = current_level
+        # Check for empty links
+        if not link_text and link.find('.//img') is None:
+            self._add_issue(
+                'error',
+                '2.4.4',
+                'Empty link with no text or image',
+                link,
+                'Add descriptive link text or alt text on linked image'
+            )
 
-    def _check_links(self, soup: BeautifulSoup):
-        """Check link accessibility - WCAG 2.4.4"""
-        links = soup.find_all('a')
+        # Check for generic link text
+        if link_text.lower() in self._GENERIC_LINK_TEXT:
+            self._add_issue(
+                'warning',
+                '2.4.4',
+                f'Generic link text: "{link_text}"',
+                link,
+                'Use descriptive link text that makes sense out of context'
+            )
 
-        for link in links:
-            link_text = link.get_text(strip=True)
+        # Check for href
+        if not link.get('href', '').strip():
+            self._add_issue(
+                'error',
+                '2.4.4',
+                'Link missing href attribute',
+                link,
+                'All links must have a valid href attribute'
+            )
 
-            # Check for empty links
-            if not link_text and not link.find('img'):
-                self._add_issue(
-                    'error',
-                    '2.4.4',
-                    'Empty link with no text or image',
-                    link,
-                    'Add descriptive link text or alt text on linked image'
-                )
+    def _check_form_control(self, input_elem: HtmlElement):
+        """Collect form inputs that need a <label> - WCAG 3.3.2"""
+        input_type = input_elem.get('type', 'text')
 
-            # Check for generic link text
-            generic_text = ['click here', 'read more', 'more', 'link', 'here']
-            if link_text.lower() in generic_text:
-                self._add_issue(
-                    'warning',
-                    '2.4.4',
-                    f'Generic link text: "{link_text}"',
-                    link,
-                    'Use descriptive link text that makes sense out of context'
-                )
+        # Skip hidden and submit/button types
+        if input_type in self._SKIP_INPUT_TYPES:
+            return
 
-            # Check for href
-            if not link.has_attr('href') or not link.get('href').strip():
-                self._add_issue(
-                    'error',
-                    '2.4.4',
-                    'Link missing href attribute',
-                    link,
-                    'All links must have a valid href attribute'
-                )
+        if input_elem.get('aria-label') or input_elem.get('aria-labelledby'):
+            return
 
-    def _check_forms(self, soup: BeautifulSoup):
-        """Check form accessibility - WCAG 1.3.1, 3.3.2"""
-        # Check inputs have labels
-        inputs = soup.find_all(['input', 'select', 'textarea'])
+        # Labels may follow the input, so the check runs after the walk
+        self._unlabelled_controls.append(input_elem)
 
-        for input_elem in inputs:
-            input_type = input_elem.get('type', 'text')
+    def _record_label(self, label: HtmlElement):
+        """Record the id a label is associated with"""
+        label_for = label.get('for')
+        if label_for:
+            self._label_targets.add(label_for)
 
-            # Skip hidden and submit/button types
-            if input_type in ['hidden', 'submit', 'button', 'reset']:
+    def _check_form_labels(self):
+        """Check form inputs have labels - WCAG 3.3.2"""
+        label_targets = self._label_targets
+        for input_elem in self._unlabelled_controls:
+            if input_elem.get('id') in label_targets:
                 continue
 
-            input_id = input_elem.get('id')
-            aria_label = input_elem.get('aria-label')
-            aria_labelledby = input_elem.get('aria-labelledby')
+            self._add_issue(
+                'error',
+                '3.3.2',
+                f'Form input missing label: {input_elem.get("name", "unnamed")}',
+                input_elem,
+                'Associate a <label> element or add aria-label attribute'
+            )
 
-            # Check for label
-            has_label = False
-            if input_id:
-                label = soup.find('label', {'for': input_id})
-                if label:
-                    has_label = True
+    def _check_fieldset(self, fieldset: HtmlElement):
+        """Check fieldsets have legends - WCAG 1.3.1"""
+        if fieldset.find('.//legend') is None:
+            self._add_issue(
+                'warning',
+                '1.3.1',
+                'Fieldset missing legend',
+                fieldset,
+                'Add <legend> to describe the group of form fields'
+            )
 
-            if not has_label and not aria_label and not aria_labelledby:
-                self._add_issue(
-                    'error',
-                    '3.3.2',
-                    f'Form input missing label: {input_elem.get("name", "unnamed")}',
-                    input_elem,
-                    'Associate a <label> element or add aria-label attribute'
-                )
+    def _record_main(self, elem: HtmlElement):
+        """Record that the page has a main landmark"""
+        self._has_main = True
 
-        # Check fieldsets have legends
-        fieldsets = soup.find_all('fieldset')
-        for fieldset in fieldsets:
-            if not fieldset.find('legend'):
-                self._add_issue(
-                    'warning',
-                    '1.3.1',
-                    'Fieldset missing legend',
-                    fieldset,
-                    'Add <legend> to describe the group of form fields'
-                )
+    def _record_nav(self, nav: HtmlElement):
+        """Record a navigation region for the page structure check"""
+        self._nav_elements.append(nav)
 
-    def _check_page_structure(self, soup: BeautifulSoup):
+    def _check_page_structure(self):
         """Check page structure - WCAG 1.3.1"""
         # Check for main landmark
-        if not soup.find('main') and not soup.find(attrs={'role': 'main'}):
+        if not self._has_main:
             self._add_issue(
                 'warning',
                 '1.3.1',
@@ -256,7 +348,7 @@ class AccessibilityAuditor:
             )
 
         # Check for navigation
-        nav_elements = soup.find_all('nav') + soup.find_all(attrs={'role': 'navigation'})
+        nav_elements = self._nav_elements
         if len(nav_elements) > 1:
             # Check if navs have labels
             for nav in nav_elements:
@@ -269,78 +361,67 @@ class AccessibilityAuditor:
                         'When multiple navs exist, label each: <nav aria-label="Main navigation">'
                     )
 
-    def _check_semantic_html(self, soup: BeautifulSoup):
+    def _check_div(self, div: HtmlElement):
         """Check for semantic HTML usage"""
-        # Check for excessive div/span usage
-        divs = soup.find_all('div')
-
-        for div in divs:
-            # Check if div is used as button
-            if div.get('onclick') or div.get('role') == 'button':
-                self._add_issue(
-                    'error',
-                    '4.1.2',
-                    'Div used as button',
-                    div,
-                    'Use <button> element instead of div with onclick'
-                )
+        # Check if div is used as button
+        if div.get('onclick') or div.get('role') == 'button':
+            self._add_issue(
+                'error',
+                '4.1.2',
+                'Div used as button',
+                div,
+                'Use <button> element instead of div with onclick'
+            )
 
-    def _check_tables(self, soup: BeautifulSoup):
+    def _check_table(self, table: HtmlElement):
         """Check table accessibility - WCAG 1.3.1"""
-        tables = soup.find_all('table')
+        # Check for caption
+        if table.find('.//caption') is None:
+            self._add_issue(
+                'warning',
+                '1.3.1',
+                'Table missing caption',
+                table,
+                'Add <caption> to describe table purpose'
+            )
 
-        for table in tables:
-            # Check for caption
-            if not table.find('caption'):
-                self._add_issue(
-                    'warning',
-                    '1.3.1',
-                    'Table missing caption',
-                    table,
-                    'Add <caption> to describe table purpose'
-                )
+        headers = self._TABLE_HEADERS(table)
+
+        # Check for th elements
+        if not headers:
+            self._add_issue(
+                'warning',
+                '1.3.1',
+                'Table has no header cells (th)',
+                table,
+                'Use <th> elements for table headers'
+            )
 
-            # Check for th elements
-            if not table.find('th'):
+        # Check th elements have scope
+        for th in headers:
+            if not th.get('scope'):
                 self._add_issue(
                     'warning',
                     '1.3.1',
-                    'Table has no header cells (th)',
-                    table,
-                    'Use <th> elements for table headers'
+                    'Table header missing scope attribute',
+                    th,
+                    'Add scope="col" or scope="row" to <th> elements'
                 )
 
-            # Check th elements have scope
-            headers = table.find_all('th')
-            for th in headers:
-                if not th.get('scope'):
-                    self._add_issue(
-                        'warning',
-                        '1.3.1',
-                        'Table header missing scope attribute',
-                        th,
-                        'Add scope="col" or scope="row" to <th> elements'
-                    )
-
-    def _check_buttons(self, soup: BeautifulSoup):
+    def _check_button(self, button: HtmlElement):
         """Check button accessibility"""
-        buttons = soup.find_all('button')
-
-        for button in buttons:
-            if not button.get_text(strip=True) and not button.find('img'):
-                self._add_issue(
-                    'error',
-                    '4.1.2',
-                    'Button has no text content',
-                    button,
-                    'Add text content or aria-label to button'
-                )
+        if not self._has_text(button) and button.find('.//img') is None:
+            self._add_issue(
+                'error',
+                '4.1.2',
+                'Button has no text content',
+                button,
+                'Add text content or aria-label to button'
+            )
 
-    def _check_language(self, soup: BeautifulSoup):
+    def _check_language(self, html_tag: HtmlElement):
         """Check language attributes - WCAG 3.1.1"""
-        html_tag = soup.find('html')
-
-        if html_tag and not html_tag.get('lang'):
+        if not html_tag.get('lang'):
             self._add_issue(
                 'error',
                 '3.1.1',
@@ -349,31 +430,42 @@ class AccessibilityAuditor:
                 'Add lang="en" to <html> element'
             )
 
-    def _check_aria_usage(self, soup: BeautifulSoup):
+    def _check_role(self, elem: HtmlElement, role: str):
         """Check ARIA usage patterns"""
-        # Find elements with ARIA roles
-        aria_elements = soup.find_all(attrs={'role': True})
-
-        for elem in aria_elements:
-            role = elem.get('role')
-
-            # Check if native HTML should be used instead
-            discouraged_roles = {
-                'button': '<button>',
-                'link': '<a href="">',
-                'checkbox': '<input type="checkbox">',
-                'radio': '<input type="radio">',
-                'textbox': '<input type="text">',
-            }
-
-            if role in discouraged_roles:
-                self._add_issue(
-                    'warning',
-                    '4.1.2',
-                    f'ARIA role="{role}" used - native HTML preferred',
-                    elem,
-                    f'Use {discouraged_roles[role]} instead of ARIA role'
-                )
+        # Landmark roles feed the page structure check
+        if role == 'main':
+            self._has_main = True
+        elif role == 'navigation' and elem.tag != 'nav':
+            self._nav_elements.append(elem)
+
+        # Check if native HTML should be used instead
+        native_element = self._DISCOURAGED_ROLES.get(role)
+        if native_element:
+            self._add_issue(
+                'warning',
+                '4.1.2',
+                f'ARIA role="{role}" used - native HTML preferred',
+                elem,
+                f'Use {native_element} instead of ARIA role'
+            )
+
+    # Per-element checks keyed by tag name, used by the audit_html walk
+    _HANDLERS = {
+        'img': _check_image,
+        **dict.fromkeys(_HEADING_LEVELS, _check_heading),
+        'a': _check_link,
+        'input': _check_form_control,
+        'select': _check_form_control,
+        'textarea': _check_form_control,
+        'label': _record_label,
+        'fieldset': _check_fieldset,
+        'main': _record_main,
+        'nav': _record_nav,
+        'div': _check_div,
+        'table': _check_table,
+        'button': _check_button,
+        'html': _check_language,
+    }
 
 
 def format_issues_text(issues: List[AccessibilityIssue], filename: str = "") -> str:
@@ -406,33 +498,138 @@ def format_issues_text(issues: List[AccessibilityIssue], filename: str = "") ->
     return "\n".join(output)
 
 
+# Issues are flat, so fields are read directly instead of via asdict's
+# recursive deep copy
+_ISSUE_FIELDS = tuple(field.name for field in fields(AccessibilityIssue))
+
+
 def format_issues_json(issues: List[AccessibilityIssue]) -> str:
     """Format issues as JSON"""
-    return json.dumps([asdict(issue) for issue in issues], indent=2)
+    if orjson is not None:
+        # orjson serializes dataclasses natively, without building dicts
+        return orjson.dumps(issues, option=orjson.OPT_INDENT_2).decode()
 
+    return json.dumps([{name: getattr(issue, name) for name in _ISSUE_FIELDS}
+                       for issue in issues], indent=2, ensure_ascii=False)
 
-def audit_file(filepath: Path, wcag_level: str = 'AA', output_format: str = 'text'):
-    """Audit a single HTML file"""
+
+def _audit_one(filepath: Path, wcag_level: str = 'AA',
+               output_format: str = 'text') -> Tuple[str, int, str]:
+    """Audit a single HTML file without printing
+
+    Returns (report, error_count, failure). Kept at module level so it can
+    be pickled and run in worker processes.
+    """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        # Let libxml2 read the file in chunks rather than holding the
+        # whole source string in memory alongside the parsed tree
+        with open(filepath, 'rb') as f:
+            # An empty file has no root and is audited as an empty document
+            root = parse(f, parser=HTMLParser(encoding='utf-8')).getroot()
 
         auditor = AccessibilityAuditor(wcag_level)
-        issues = auditor.audit_html(html_content, filepath.name)
+        issues = auditor.audit_tree(root)
 
         if output_format == 'json':
-            print(format_issues_json(issues))
+            report = format_issues_json(issues)
         else:
-            print(format_issues_text(issues, filepath.name))
+            report = format_issues_text(issues, filepath.name)
 
-        return len([i for i in issues if i.severity == 'error'])
+        return report, len([i for i in issues if i.severity == 'error']), ""
 
     except Exception as e:
-        print(f"Error auditing {filepath}: {e}", file=sys.stderr)
-        return 1
+        return "", 1, f"Error auditing {filepath}: {e}"
+
+
+def _print_result(result: Tuple[str, int, str]) -> int:
+    """Print the outcome of _audit_one and return its error count"""
+    report, errors, failure = result
+    if failure:
+        print(failure, file=sys.stderr)
+    else:
+        print(report)
+    return errors
+
+
+# Results cache used with --cache, keyed by file and audit options
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'accessibility_audit')
+
+
+def _cache_entry(filepath: Path, wcag_level: str, output_format: str) -> Tuple[str, tuple]:
+    """Return the cache key and validity signature for a file
 
+    The signature changes when the file or this script is modified.
+    """
+    key = f"{filepath.resolve()}|{wcag_level}|{output_format}"
+    stat = filepath.stat()
+    signature = (stat.st_mtime_ns, stat.st_size, os.stat(__file__).st_mtime_ns)
+    return key, signature
 
-def audit_directory(dirpath: Path, wcag_level: str = 'AA', output_format: str = 'text'):
+
+def _audit_files(html_files: List[Path], wcag_level: str = 'AA',
+                 output_format: str = 'text', use_cache: bool = False,
+                 jobs: int = None) -> List[Tuple[str, int, str]]:
+    """Audit HTML files and return their _audit_one results in input order
+
+    Files are independent, so several are audited in up to `jobs` worker
+    processes (default: one per CPU). With use_cache, files unchanged since
+    they were last cached are skipped.
+    """
+    results = [None] * len(html_files)
+    cache = None
+    if use_cache:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        cache = shelve.open(CACHE_PATH)
+
+    try:
+        entries = {}
+        if cache is not None:
+            for i, filepath in enumerate(html_files):
+                try:
+                    key, signature = _cache_entry(filepath, wcag_level, output_format)
+                except OSError:
+                    # e.g. a broken symlink or a file removed since it was
+                    # listed; _audit_one reports the failure
+                    continue
+                entries[i] = key, signature
+                cached = cache.get(key)
+                if cached is not None and cached[0] == signature:
+                    results[i] = cached[1]
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        audit = partial(_audit_one, wcag_level=wcag_level, output_format=output_format)
+        workers = min(jobs or os.cpu_count() or 1, len(pending))
+        if workers > 1:
+            # Small batches go one file per task so every worker gets work;
+            # large ones are split into ~4 chunks per worker to cut IPC
+            chunksize = max(1, len(pending) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                fresh = list(executor.map(audit, [html_files[i] for i in pending],
+                                          chunksize=chunksize))
+        else:
+            fresh = [audit(html_files[i]) for i in pending]
+
+        for i, result in zip(pending, fresh):
+            results[i] = result
+            # Only successful audits are cached
+            if i in entries and not result[2]:
+                key, signature = entries[i]
+                cache[key] = (signature, result)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    return results
+
+
+def audit_file(filepath: Path, wcag_level: str = 'AA', output_format: str = 'text',
+               use_cache: bool = False):
+    """Audit a single HTML file"""
+    return _print_result(_audit_files([filepath], wcag_level, output_format, use_cache)[0])
+
+
+def audit_directory(dirpath: Path, wcag_level: str = 'AA', output_format: str = 'text',
+                    use_cache: bool = False, jobs: int = None):
     """Audit all HTML files in a directory"""
     html_files = list(dirpath.rglob('*.html'))
 
@@ -442,10 +639,10 @@ def audit_directory(dirpath: Path, wcag_level: str = 'AA', output_format: str =
 
     print(f"Found {len(html_files)} HTML file(s) to audit\n")
 
+    # Output is printed here, after the parallel phase, to avoid interleaving
     total_errors = 0
-    for filepath in html_files:
-        errors = audit_file(filepath, wcag_level, output_format)
-        total_errors += errors
+    for result in _audit_files(html_files, wcag_level, output_format, use_cache, jobs):
+        total_errors += _print_result(result)
         if output_format == 'text':
             print("\n" + "=" * 60 + "\n")
 
@@ -460,33 +657,36 @@ def audit_directory(dirpath: Path, wcag_level: str = 'AA', output_format: str =
 
 def main():
     """Main entry point"""
-    if len(sys.argv) < 2:
-        print(__doc__)
-        sys.exit(1)
-
-    path = Path(sys.argv[1])
-    wcag_level = 'AA'
-    output_format = 'text'
-
-    # Parse options
-    if '--wcag-level' in sys.argv:
-        idx = sys.argv.index('--wcag-level')
-        if idx + 1 < len(sys.argv):
-            wcag_level = sys.argv[idx + 1]
-
-    if '--format' in sys.argv:
-        idx = sys.argv.index('--format')
-        if idx + 1 < len(sys.argv):
-            output_format = sys.argv[idx + 1]
-
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('path', type=Path,
+                        help='HTML file or directory to audit')
+    parser.add_argument('--wcag-level', choices=['A', 'AA', 'AAA'], default='AA',
+                        help='WCAG conformance level (default: AA)')
+    parser.add_argument('--format', dest='output_format', choices=['text', 'json'],
+                        default='text', help='output format (default: text)')
+    parser.add_argument('--cache', action='store_true',
+                        help='reuse results for files unchanged since the last cached audit '
+                             f'(stored in {CACHE_PATH})')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='worker processes for directory audits (default: one per CPU)')
+    args = parser.parse_args()
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
+    path = args.path
     if not path.exists():
         print(f"Error: Path not found: {path}", file=sys.stderr)
         sys.exit(1)
 
     if path.is_file():
-        exit_code = audit_file(path, wcag_level, output_format)
+        exit_code = audit_file(path, args.wcag_level, args.output_format, args.cache)
     else:
-        exit_code = audit_directory(path, wcag_level, output_format)
+        exit_code = audit_directory(path, args.wcag_level, args.output_format,
+                                    args.cache, args.jobs)
 
     sys.exit(exit_code)
 
@@ -13,6 +13,7 @@ Usage:
 
 Requirements:
     Standard library only - no external dependencies needed
+    (NumPy is used for batch luminance calculations when installed)
 
 WCAG Requirements:
     Level AA:
@@ -27,7 +28,37 @@ WCAG Requirements:
 
 import sys
 import re
-from typing import Tuple
+import argparse
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Color formats accepted by ColorContrastChecker.parse_color
+_HEX_DIGITS = frozenset('0123456789abcdef')
+_RGB_COLOR = re.compile(r'rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)')
+
+
+def _linearize(channel: float) -> float:
+    """Apply sRGB gamma correction to a channel in the range 0-1"""
+    if channel <= 0.03928:
+        return channel / 12.92
+    return ((channel + 0.055) / 1.055) ** 2.4
+
+
+# Channels are always 8-bit, so gamma correction is precomputed for all
+# 256 values and luminance becomes three table lookups
+_LINEAR_CHANNEL = tuple(_linearize(val / 255.0) for val in range(256))
+_LUMINANCE_WEIGHTS = (0.2126, 0.7152, 0.0722)
+
+# NumPy copies of the tables are built once for array input to
+# get_relative_luminance_batch
+if np is not None:
+    _LINEAR_CHANNEL_ARRAY = np.array(_LINEAR_CHANNEL)
+    _LUMINANCE_WEIGHTS_ARRAY = np.array(_LUMINANCE_WEIGHTS)
 
 
 class ColorContrastChecker:
@@ -65,48 +96,45 @@ class ColorContrastChecker:
 
         # Check for named color
         if color_str in self.NAMED_COLORS:
-            color_str = self.NAMED_COLORS[color_str]
-
-        # Parse hex color
-        hex_match = re.match(r'#?([0-9a-f]{6})', color_str)
-        if hex_match:
-            hex_color = hex_match.group(1)
-            return (
-                int(hex_color[0:2], 16),
-                int(hex_color[2:4], 16),
-                int(hex_color[4:6], 16)
-            )
-
-        # Parse short hex color (#RGB -> #RRGGBB)
-        short_hex_match = re.match(r'#?([0-9a-f])([0-9a-f])([0-9a-f])$', color_str)
-        if short_hex_match:
-            r, g, b = short_hex_match.groups()
-            return (int(r + r, 16), int(g + g, 16), int(b + b, 16))
+            color_str = self.NAMED_COLORS[color_str].lower()
 
-        # Parse rgb() format
-        rgb_match = re.match(r'rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)', color_str)
-        if rgb_match:
-            return tuple(map(int, rgb_match.groups()))
-
-        raise ValueError(f"Could not parse color: {color_str}")
+        return _parse_color(color_str)
 
     def get_relative_luminance(self, rgb: Tuple[int, int, int]) -> float:
-        """Calculate relative luminance for RGB color"""
-        # Convert to sRGB
-        r, g, b = [val / 255.0 for val in rgb]
+        """Calculate relative luminance for RGB color (8-bit channels, 0-255)"""
+        r, g, b = rgb
+        # Guard the table lookup: negative indexes would wrap silently
+        if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+            raise ValueError(f"RGB channels must be in the range 0-255: {tuple(rgb)}")
+        return (0.2126 * _LINEAR_CHANNEL[r] +
+                0.7152 * _LINEAR_CHANNEL[g] +
+                0.0722 * _LINEAR_CHANNEL[b])
+
+    def get_relative_luminance_batch(self, rgbs: Sequence[Tuple[int, int, int]]) -> List[float]:
+        """Calculate relative luminance for many RGB colors at once
+
+        Accepts a sequence of RGB tuples or an (N, 3) integer NumPy array.
+        Only array input takes the vectorized path: converting a sequence
+        of tuples to an array costs more than the table lookups themselves,
+        so sequences (such as the candidates in suggest_adjustments) are
+        handled in pure Python.
+        """
+        if np is None or not isinstance(rgbs, np.ndarray):
+            return [self.get_relative_luminance(rgb) for rgb in rgbs]
 
-        # Apply gamma correction
-        def adjust(channel):
-            if channel <= 0.03928:
-                return channel / 12.92
-            return ((channel + 0.055) / 1.055) ** 2.4
+        if rgbs.size and (rgbs.min() < 0 or rgbs.max() > 255):
+            raise ValueError("RGB channels must be in the range 0-255")
+        return (_LINEAR_CHANNEL_ARRAY[rgbs] @ _LUMINANCE_WEIGHTS_ARRAY).tolist()
 
-        r_lin = adjust(r)
-        g_lin = adjust(g)
-        b_lin = adjust(b)
+    def get_contrast_ratios(self, rgbs: Sequence[Tuple[int, int, int]],
+                            other: Tuple[int, int, int]) -> List[float]:
+        """Calculate contrast ratios between many RGB colors and one other color"""
+        lums = self.get_relative_luminance_batch(rgbs)
+        other_lum = self.get_relative_luminance(other)
 
-        # Calculate luminance
-        return 0.2126 * r_lin + 0.7152 * g_lin + 0.0722 * b_lin
+        return [(lum + 0.05) / (other_lum + 0.05) if lum >= other_lum
+                else (other_lum + 0.05) / (lum + 0.05)
+                for lum in lums]
 
     def get_contrast_ratio(self, color1: str, color2: str) -> float:
         """Calculate contrast ratio between two colors"""
@@ -116,9 +144,8 @@ class ColorContrastChecker:
         lum1 = self.get_relative_luminance(rgb1)
         lum2 = self.get_relative_luminance(rgb2)
 
-        # Ensure lighter color is in numerator
-        lighter = max(lum1, lum2)
-        darker = min(lum1, lum2)
+        # Ensure lighter color is in numerator (one comparison, no calls)
+        lighter, darker = (lum1, lum2) if lum1 >= lum2 else (lum2, lum1)
 
         return (lighter + 0.05) / (darker + 0.05)
 
@@ -167,6 +194,37 @@ class ColorContrastChecker:
         }
 
 
+@lru_cache(maxsize=1024)
+def _parse_color(color_str: str) -> Tuple[int, int, int]:
+    """Parse a lowercase hex or rgb() color string to RGB tuple
+
+    Named colors are resolved by ColorContrastChecker.parse_color first.
+    Memoized: parsing is a pure function of the input string, and real
+    usage repeats a small set of colors.
+    """
+    # Parse hex color (#RRGGBB or #RGB) without the regex engine
+    hex_color = color_str[1:] if color_str.startswith('#') else color_str
+    if _HEX_DIGITS.issuperset(hex_color):
+        if len(hex_color) == 6:
+            return (
+                int(hex_color[0:2], 16),
+                int(hex_color[2:4], 16),
+                int(hex_color[4:6], 16)
+            )
+        if len(hex_color) == 3:
+            r, g, b = hex_color
+            return (int(r + r, 16), int(g + g, 16), int(b + b, 16))
+
+    # Parse rgb() format
+    rgb_match = _RGB_COLOR.match(color_str)
+    if rgb_match:
+        rgb = tuple(map(int, rgb_match.groups()))
+        if max(rgb) <= 255:
+            return rgb
+
+    raise ValueError(f"Could not parse color: {color_str}")
+
+
 def format_result(result: dict) -> str:
     """Format contrast check result as readable text"""
     lines = []
@@ -222,53 +280,57 @@ def suggest_adjustments(foreground: str, background: str, target_ratio: float =
     print(f"\nSuggestions to achieve {target_ratio}:1 ratio:")
     print("-" * 60)
 
+    adjustments = [20, 40, 60, 80, 100]
+
     # Try darkening foreground
-    for adjustment in [20, 40, 60, 80, 100]:
-        adjusted_fg = tuple(max(0, val - adjustment) for val in fg_rgb)
-        adjusted_hex = '#{:02x}{:02x}{:02x}'.format(*adjusted_fg)
-        ratio = checker.get_contrast_ratio(adjusted_hex, background)
+    candidates = [tuple(max(0, val - adjustment) for val in fg_rgb)
+                  for adjustment in adjustments]
+    ratios = checker.get_contrast_ratios(candidates, bg_rgb)
+    for adjusted_fg, ratio in zip(candidates, ratios):
         if ratio >= target_ratio:
+            adjusted_hex = '#{:02x}{:02x}{:02x}'.format(*adjusted_fg)
             print(f"✓ Darken foreground to {adjusted_hex} → {ratio:.2f}:1")
             break
 
     # Try lightening background
-    for adjustment in [20, 40, 60, 80, 100]:
-        adjusted_bg = tuple(min(255, val + adjustment) for val in bg_rgb)
-        adjusted_hex = '#{:02x}{:02x}{:02x}'.format(*adjusted_bg)
-        ratio = checker.get_contrast_ratio(foreground, adjusted_hex)
+    candidates = [tuple(min(255, val + adjustment) for val in bg_rgb)
+                  for adjustment in adjustments]
+    ratios = checker.get_contrast_ratios(candidates, fg_rgb)
+    for adjusted_bg, ratio in zip(candidates, ratios):
         if ratio >= target_ratio:
+            adjusted_hex = '#{:02x}{:02x}{:02x}'.format(*adjusted_bg)
             print(f"✓ Lighten background to {adjusted_hex} → {ratio:.2f}:1")
             break
 
 
 def main():
     """Main entry point"""
-    if len(sys.argv) < 3:
-        print(__doc__)
-        print("\nExamples:")
-        print('  python contrast_checker.py "#000000" "#FFFFFF"')
-        print('  python contrast_checker.py "rgb(0,0,0)" "#FFF"')
-        print('  python contrast_checker.py "#767676" "white" --level AAA')
-        print('  python contrast_checker.py "#999" "#FFF" --large-text')
-        sys.exit(1)
-
-    foreground = sys.argv[1]
-    background = sys.argv[2]
-    level = 'AA'
-    large_text = False
-    show_suggestions = False
-
-    # Parse options
-    if '--level' in sys.argv:
-        idx = sys.argv.index('--level')
-        if idx + 1 < len(sys.argv):
-            level = sys.argv[idx + 1].upper()
-
-    if '--large-text' in sys.argv:
-        large_text = True
-
-    if '--suggest' in sys.argv:
-        show_suggestions = True
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="\n".join([
+            "Examples:",
+            '  python contrast_checker.py "#000000" "#FFFFFF"',
+            '  python contrast_checker.py "rgb(0,0,0)" "#FFF"',
+            '  python contrast_checker.py "#767676" "white" --level AAA',
+            '  python contrast_checker.py "#999" "#FFF" --large-text',
+        ])
+    )
+    parser.add_argument('foreground', help='foreground (text) color')
+    parser.add_argument('background', help='background color')
+    parser.add_argument('--level', type=str.upper, choices=['AA', 'AAA'], default='AA',
+                        help='WCAG level to check against (default: AA)')
+    parser.add_argument('--large-text', action='store_true',
+                        help='apply large text (18pt+ or 14pt+ bold) requirements')
+    parser.add_argument('--suggest', action='store_true',
+                        help='suggest adjusted colors if the check fails')
+    args = parser.parse_args()
+
+    foreground = args.foreground
+    background = args.background
+    level = args.level
+    large_text = args.large_text
+    show_suggestions = args.suggest
 
     try:
         checker = ColorContrastChecker()